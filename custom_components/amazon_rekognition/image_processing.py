@@ -2,13 +2,20 @@
 Platform that will perform object detection.
 """
 from collections import namedtuple, Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+import hashlib
 import io
 import logging
+import queue
 import re
+import threading
 import time
 from pathlib import Path
 
-from PIL import Image, ImageDraw, UnidentifiedImageError
+import boto3
+from botocore.config import Config
+from PIL import Image, UnidentifiedImageError
 
 import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
@@ -24,10 +31,9 @@ from homeassistant.components.image_processing import (
     PLATFORM_SCHEMA,
     ImageProcessingEntity,
 )
-from homeassistant.core import split_entity_id
-from homeassistant.util.pil import draw_box
+from homeassistant.core import callback, split_entity_id
 
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, EVENT_HOMEASSISTANT_STOP
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,12 +61,14 @@ SUPPORTED_REGIONS = [
 ]
 
 CONF_BOTO_RETRIES = "boto_retries"
+CONF_MAX_PARALLEL_REQUESTS = "max_parallel_requests"
 CONF_SAVE_FILE_FORMAT = "save_file_format"
 CONF_SAVE_FILE_FOLDER = "save_file_folder"
 CONF_SAVE_TIMESTAMPTED_FILE = "save_timestamped_file"
 CONF_ALWAYS_SAVE_LATEST_FILE = "always_save_latest_file"
 CONF_SHOW_BOXES = "show_boxes"
 CONF_SCALE = "scale"
+CONF_MAX_DIMENSION = "max_dimension"
 CONF_TARGET = "target"
 CONF_TARGETS = "targets"
 CONF_S3_BUCKET = "s3_bucket"
@@ -71,7 +79,11 @@ CONF_ROI_Y_MAX = "roi_y_max"
 CONF_ROI_X_MAX = "roi_x_max"
 
 DATETIME_FORMAT = "%Y-%m-%d_%H:%M:%S"
+INVALID_FILENAME_CHARS = re.compile(r"(?u)[^-\w.]")
 DEFAULT_BOTO_RETRIES = 5
+DEFAULT_MAX_PARALLEL_REQUESTS = 20
+MAX_REQUESTS_PER_SECOND = 50  # The default DetectLabels quota
+PENDING_SAVES_PER_CAMERA = 2  # Each pending save holds a full camera image
 PERSON = "person"
 DEFAULT_TARGETS = [{CONF_TARGET: PERSON}]
 DEFAULT_ROI_Y_MIN = 0.0
@@ -79,6 +91,7 @@ DEFAULT_ROI_Y_MAX = 1.0
 DEFAULT_ROI_X_MIN = 0.0
 DEFAULT_ROI_X_MAX = 1.0
 DEAULT_SCALE = 1.0
+DEFAULT_MAX_DIMENSION = 1280
 DEFAULT_ROI = (
     DEFAULT_ROI_Y_MIN,
     DEFAULT_ROI_X_MIN,
@@ -96,6 +109,8 @@ SAVED_FILE = "saved_file"
 MIN_CONFIDENCE = 0.1
 JPG = "jpg"
 PNG = "png"
+PIL_FORMATS = {JPG: "JPEG", PNG: "PNG"}
+RGB_MODES = {JPG: ("RGB",), PNG: ("RGB", "RGBA")}
 
 # rgb(red, green, blue)
 RED = (255, 0, 0)  # For objects within the ROI
@@ -126,6 +141,9 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_SCALE, default=DEAULT_SCALE): vol.All(
             vol.Coerce(float, vol.Range(min=0.1, max=1))
         ),
+        vol.Optional(CONF_MAX_DIMENSION, default=DEFAULT_MAX_DIMENSION): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
         vol.Optional(CONF_SAVE_FILE_FOLDER): cv.isdir,
         vol.Optional(CONF_SAVE_FILE_FORMAT, default=JPG): vol.In([JPG, PNG]),
         vol.Optional(CONF_SAVE_TIMESTAMPTED_FILE, default=False): cv.boolean,
@@ -135,6 +153,9 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_BOTO_RETRIES, default=DEFAULT_BOTO_RETRIES): vol.All(
             vol.Coerce(int), vol.Range(min=0)
         ),
+        vol.Optional(
+            CONF_MAX_PARALLEL_REQUESTS, default=DEFAULT_MAX_PARALLEL_REQUESTS
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_REQUESTS_PER_SECOND)),
     }
 )
 
@@ -143,6 +164,96 @@ Box = namedtuple("Box", "y_min x_min y_max x_max")
 Point = namedtuple("Point", "y x")
 
 
+class RateLimiter:
+    """Space out calls from any thread to at most rate per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Shared by every entity, since the AWS quota is per account.
+REKOGNITION_RATE_LIMITER = RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+class ImageWriter:
+    """Run save jobs in order on a single thread.
+
+    A replaceable job still waiting in the queue is swapped for the next job
+    with the same key, so a camera never has more than one of them pending.
+    Other jobs are never dropped, submit blocks while the queue is full instead.
+    """
+
+    def __init__(self, maxsize: int):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._replaceable = {}  # key -> queued job that may still be replaced
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="rekognition_image_writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, key, fn, *args, replaceable=False) -> Future:
+        """Queue fn(*args), returning a future that is cancelled if it is replaced."""
+        future = Future()
+        with self._lock:
+            if self._stopped:
+                future.cancel()
+                return future
+            job = self._replaceable.get(key)
+            if job is not None:
+                # Still queued, so take over its place in the queue
+                job[1].cancel()
+                job[1:] = [future, fn, args]
+                if not replaceable:
+                    del self._replaceable[key]
+                return future
+            job = [key, future, fn, args]
+            if replaceable:
+                self._replaceable[key] = job
+        self._queue.put(job)
+        return future
+
+    def stop(self):
+        """Stop taking jobs, the thread exits once the queued ones have run."""
+        with self._lock:
+            self._stopped = True
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass  # The thread sees _stopped once it has emptied the queue
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                if self._replaceable.get(job[0]) is job:
+                    del self._replaceable[job[0]]
+                _, future, fn, args = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args)
+                except Exception as error:  # pylint: disable=broad-except
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            if self._stopped and self._queue.empty():
+                return
+
+
 def point_in_box(box: Box, point: Point) -> bool:
     """Return true if point lies in box"""
     if (box.x_min <= point.x <= box.x_max) and (box.y_min <= point.y <= box.y_max):
@@ -157,15 +268,23 @@ def object_in_roi(roi: dict, centroid: dict) -> bool:
     return point_in_box(roi_box, target_center_point)
 
 
-def get_objects(response: str) -> dict:
-    """Parse the data, returning detected objects only."""
+def parse_response(response: dict, targets_confidence: dict, roi: dict) -> tuple:
+    """Parse the data in a single pass, returning objects, labels and targets found.
+
+    targets_confidence maps lowercased target names to their confidence, an object
+    is a target if its confidence exceeds this and its centroid lies in the roi.
+    """
     objects = []
     labels = []
+    targets_found = []
     decimal_places = 3
 
     for label in response["Labels"]:
-        if len(label["Instances"]) > 0:
-            for instance in label["Instances"]:
+        name = label["Name"].lower()
+        instances = label["Instances"]
+        if instances:
+            target_confidence = targets_confidence.get(name)
+            for instance in instances:
                 # Extract and format instance data
                 box = instance["BoundingBox"]
                 # Get bounding box
@@ -182,8 +301,8 @@ def get_objects(response: str) -> dict:
                     "y_min": round(y_min, decimal_places),
                     "x_max": round(x_max, decimal_places),
                     "y_max": round(y_max, decimal_places),
-                    "width": round(box["Width"], decimal_places),
-                    "height": round(box["Height"], decimal_places),
+                    "width": round(width, decimal_places),
+                    "height": round(height, decimal_places),
                 }
 
                 # Get box area (% of frame)
@@ -196,33 +315,83 @@ def get_objects(response: str) -> dict:
                     "y": round(centroid_y, decimal_places),
                 }
 
-                objects.append(
-                    {
-                        "name": label["Name"].lower(),
-                        "confidence": round(instance["Confidence"], decimal_places),
-                        "bounding_box": bounding_box,
-                        "box_area": round(box_area, decimal_places),
-                        "centroid": centroid,
-                    }
-                )
+                confidence = round(instance["Confidence"], decimal_places)
+                obj = {
+                    "name": name,
+                    "confidence": confidence,
+                    "bounding_box": bounding_box,
+                    "box_area": round(box_area, decimal_places),
+                    "centroid": centroid,
+                }
+                objects.append(obj)
+
+                if target_confidence is None or confidence <= target_confidence:
+                    continue
+                if object_in_roi(roi, centroid):
+                    targets_found.append(obj)
         else:
             label_info = {
-                "name": label["Name"].lower(),
+                "name": name,
                 "confidence": round(label["Confidence"], decimal_places),
             }
             labels.append(label_info)
+    return objects, labels, targets_found
+
+
+def get_objects(response: dict) -> tuple:
+    """Parse the data, returning detected objects only."""
+    objects, labels, _ = parse_response(response, {}, {})
     return objects, labels
 
 
+def resize_image(image: bytes, max_dimension: int) -> bytes:
+    """Shrink the image to fit within max_dimension, returning JPEG bytes."""
+    img = Image.open(io.BytesIO(image))
+    img.thumbnail((max_dimension, max_dimension), Image.BILINEAR)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    with io.BytesIO() as output:
+        img.save(output, format="JPEG", quality=85)
+        return output.getvalue()
+
+
 def get_valid_filename(name: str) -> str:
-    return re.sub(r"(?u)[^-\w.]", "", str(name).strip().replace(" ", "_"))
+    return INVALID_FILENAME_CHARS.sub("", str(name).strip().replace(" ", "_"))
+
+
+def draw_box(draw, box, img_width, img_height, font, text="", color=YELLOW):
+    """Draw a bounding box and its label on an image.
+
+    Like homeassistant.util.pil.draw_box, but takes a font the caller has
+    already loaded, saving a load_default() for every image saved.
+    """
+    line_width = 3
+    font_height = 8
+    y_min, x_min, y_max, x_max = box
+    left, right, top, bottom = (
+        x_min * img_width,
+        x_max * img_width,
+        y_min * img_height,
+        y_max * img_height,
+    )
+    # A polyline rather than draw.rectangle, which rejects an inverted roi
+    draw.line(
+        [(left, top), (left, bottom), (right, bottom), (right, top), (left, top)],
+        width=line_width,
+        fill=color,
+    )
+    if text:
+        draw.text(
+            (left + line_width, abs(top - line_width - font_height)),
+            text,
+            fill=color,
+            font=font,
+        )
 
 
 def setup_platform(hass, config, add_devices, discovery_info=None):
     """Set up ObjectDetection."""
 
-    import boto3
-
     _LOGGER.debug("boto_retries setting is {}".format(config[CONF_BOTO_RETRIES]))
 
     aws_config = {
@@ -230,33 +399,40 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
         CONF_ACCESS_KEY_ID: config[CONF_ACCESS_KEY_ID],
         CONF_SECRET_ACCESS_KEY: config[CONF_SECRET_ACCESS_KEY],
     }
-
-    retries = 0
-    success = False
-    while retries <= config[CONF_BOTO_RETRIES]:
-        try:
-            rekognition_client = boto3.client("rekognition", **aws_config)
-            success = True
-            break
-        except KeyError:
-            _LOGGER.info("boto3 client failed, retries={}".format(retries))
-            retries += 1
-            time.sleep(1)
-
-    if not success:
-        raise Exception(
-            "Failed to create boto3 client. Maybe try increasing "
-            "the boto_retries setting. Retry counter was {}".format(retries)
-        )
+    # Size the connection pool so cameras don't queue on the default of 10,
+    # and let botocore retry throttled and transient failures.
+    boto_config = Config(
+        max_pool_connections=max(10, config[CONF_MAX_PARALLEL_REQUESTS]),
+        retries={"max_attempts": config[CONF_BOTO_RETRIES], "mode": "standard"},
+    )
+    session = boto3.session.Session(**aws_config)
+    rekognition_client = session.client("rekognition", config=boto_config)
 
     if config.get(CONF_S3_BUCKET):
-        s3_client = boto3.client("s3", **aws_config)
+        s3_client = session.client("s3", config=boto_config)
     else:
         s3_client = None
 
+    # Rekognition calls are I/O bound, so give them their own pool shared by all
+    # cameras rather than competing with Home Assistant for the default executor.
+    executor = ThreadPoolExecutor(max_workers=config[CONF_MAX_PARALLEL_REQUESTS])
     save_file_folder = config.get(CONF_SAVE_FILE_FOLDER)
     if save_file_folder:
         save_file_folder = Path(save_file_folder)
+        # A single thread saves images, so slow storage never holds up detection
+        # and saves of the same latest file can't interleave.
+        writer = ImageWriter(
+            maxsize=PENDING_SAVES_PER_CAMERA * len(config[CONF_SOURCE])
+        )
+    else:
+        writer = None
+
+    def shutdown_executors(event):
+        executor.shutdown(wait=False)
+        if writer:
+            writer.stop()
+
+    hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, shutdown_executors)
 
     entities = []
     for camera in config[CONF_SOURCE]:
@@ -264,6 +440,8 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
             ObjectDetection(
                 rekognition_client=rekognition_client,
                 s3_client=s3_client,
+                executor=executor,
+                writer=writer,
                 region=config.get(CONF_REGION),
                 targets=config.get(CONF_TARGETS),
                 confidence=config.get(CONF_CONFIDENCE),
@@ -272,6 +450,7 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
                 roi_y_max=config[CONF_ROI_Y_MAX],
                 roi_x_max=config[CONF_ROI_X_MAX],
                 scale=config[CONF_SCALE],
+                max_dimension=config[CONF_MAX_DIMENSION],
                 show_boxes=config[CONF_SHOW_BOXES],
                 save_file_format=config[CONF_SAVE_FILE_FORMAT],
                 save_file_folder=save_file_folder,
@@ -292,6 +471,8 @@ class ObjectDetection(ImageProcessingEntity):
         self,
         rekognition_client,
         s3_client,
+        executor,
+        writer,
         region,
         targets,
         confidence,
@@ -300,6 +481,7 @@ class ObjectDetection(ImageProcessingEntity):
         roi_y_max,
         roi_x_max,
         scale,
+        max_dimension,
         show_boxes,
         save_file_format,
         save_file_folder,
@@ -312,13 +494,18 @@ class ObjectDetection(ImageProcessingEntity):
         """Init with the client."""
         self._aws_rekognition_client = rekognition_client
         self._aws_s3_client = s3_client
+        self._executor = executor
+        self._writer = writer
         self._aws_region = region
         self._confidence = confidence
         self._targets = targets
         for target in self._targets:
             if CONF_CONFIDENCE not in target.keys():
                 target.update({CONF_CONFIDENCE: self._confidence})
-        self._targets_names = [target[CONF_TARGET] for target in targets]
+        self._targets_names = [target[CONF_TARGET].lower() for target in targets]
+        self._targets_confidence = {
+            target[CONF_TARGET].lower(): target[CONF_CONFIDENCE] for target in targets
+        }  # Lowercased target name -> confidence, e.g. {'person': 80.0}
         self._summary = {target: 0 for target in self._targets_names}
 
         self._camera_entity = camera_entity
@@ -327,6 +514,7 @@ class ObjectDetection(ImageProcessingEntity):
         else:
             entity_name = split_entity_id(camera_entity)[1]
             self._name = f"rekognition_{entity_name}"
+        self._valid_filename = get_valid_filename(self._name).lower()
 
         self._state = None  # The number of instances of interest
         self._last_detection = None  # The last time we detected a target
@@ -341,6 +529,7 @@ class ObjectDetection(ImageProcessingEntity):
             "x_max": roi_x_max,
         }
         self._scale = scale
+        self._max_dimension = max_dimension
         self._show_boxes = show_boxes
         self._last_detection = None
         self._image_width = None
@@ -351,49 +540,44 @@ class ObjectDetection(ImageProcessingEntity):
         self._always_save_latest_file = always_save_latest_file
         self._s3_bucket = s3_bucket
         self._image = None
+        self._last_image_hash = None
+        self._last_response = None
+        self._font = None  # Loaded on first save
 
-    def process_image(self, image):
-        """Process an image."""
-        self._image = Image.open(io.BytesIO(bytearray(image)))  # used for saving only
-        self._image_width, self._image_height = self._image.size
-
-        # resize image if different then default
-        if self._scale != DEAULT_SCALE:
-            newsize = (self._image_width * self._scale, self._image_width * self._scale)
-            self._image.thumbnail(newsize, Image.ANTIALIAS)
-            self._image_width, self._image_height = self._image.size
-            with io.BytesIO() as output:
-                self._image.save(output, format="JPEG")
-                image = output.getvalue()
-            _LOGGER.debug(
-                (
-                    f"Image scaled with : {self._scale} W={self._image_width} H={self._image_height}"
-                )
+    async def async_process_image(self, image):
+        """Process an image in the Rekognition executor."""
+        try:
+            job = self.hass.loop.run_in_executor(
+                self._executor, self.process_image, image
             )
+        except RuntimeError:
+            # The executor is shut down once Home Assistant is stopping
+            _LOGGER.debug("Home Assistant is stopping, not processing image")
+            return
+        await job
 
+    def process_image(self, image):
+        """Process an image."""
         self._state = None
         self._objects = []
         self._labels = []
         self._targets_found = []
         self._summary = {target: 0 for target in self._targets_names}
-        saved_image_path = None
 
-        response = self._aws_rekognition_client.detect_labels(Image={"Bytes": image})
-        self._objects, self._labels = get_objects(response)
-        self._targets_found = []
+        # Idle cameras often repeat the same frame, don't pay to scale and detect
+        # it again. Saving only needs the camera image, so nothing else is cached.
+        image_hash = hashlib.blake2b(image, digest_size=8).digest()
+        if image_hash == self._last_image_hash:
+            response = self._last_response
+            _LOGGER.debug("Image unchanged, reusing the last Rekognition response")
+        else:
+            response = self._detect_labels(image)
+            self._last_image_hash = image_hash
+            self._last_response = response
 
-        for obj in self._objects:
-            if not ((obj["name"] in self._targets_names)):
-                continue
-            ## Then if a confidence for a named object, this takes precedence over type confidence
-            confidence = None
-            for target in self._targets:
-                if obj["name"] == target[CONF_TARGET]:
-                    confidence = target[CONF_CONFIDENCE]
-            if obj["confidence"] > confidence:
-                if not object_in_roi(self._roi_dict, obj["centroid"]):
-                    continue
-                self._targets_found.append(obj)
+        self._objects, self._labels, self._targets_found = parse_response(
+            response, self._targets_confidence, self._roi_dict
+        )
 
         self._state = len(self._targets_found)
 
@@ -408,24 +592,84 @@ class ObjectDetection(ImageProcessingEntity):
             if target not in self._summary.keys():
                 self._summary.update({target: 0})
 
-        if self._save_file_folder:
-            if self._state > 0 or self._always_save_latest_file:
-                saved_image_path = self.save_image(
-                    self._targets_found, self._save_file_folder,
-                )
+        # Saving is slow so it is handed off, object events wait for it so that
+        # any saved_file they carry has been written.
+        if self._save_file_folder and (
+            self._state > 0 or self._always_save_latest_file
+        ):
+            # Only a save of just the latest file can be replaced by a newer one,
+            # timestamped files and S3 backups are always kept.
+            self._writer.submit(
+                self,
+                self.save_image,
+                image,
+                self._targets_found,
+                self._save_file_folder,
+                self._last_detection,
+                replaceable=not self._save_timestamped_file,
+            ).add_done_callback(partial(self._save_done, self._targets_found))
+        else:
+            self.hass.add_job(self._async_fire_object_events, self._targets_found)
 
         # Fire events
-        for target in self._targets_found:
-            target_event_data = target.copy()
-            target_event_data[ATTR_ENTITY_ID] = self.entity_id
-            if saved_image_path:
-                target_event_data[SAVED_FILE] = saved_image_path
-            self.hass.bus.fire(EVENT_OBJECT_DETECTED, target_event_data)
         for label in self._labels:
             label_event_data = label.copy()
             label_event_data[ATTR_ENTITY_ID] = self.entity_id
             self.hass.bus.fire(EVENT_LABEL_DETECTED, label_event_data)
 
+    def _save_done(self, targets, future: Future):
+        """Fire the object events once the image save has finished or been cancelled."""
+        saved_image_path = None
+        if future.cancelled():
+            _LOGGER.debug("Rekognition image save replaced by a newer one or stopped")
+        elif future.exception():
+            _LOGGER.error("Rekognition failed to save image: %s", future.exception())
+        else:
+            saved_image_path = future.result()
+        self.hass.add_job(self._async_fire_object_events, targets, saved_image_path)
+
+    @callback
+    def _async_fire_object_events(self, targets, saved_image_path=None):
+        """Fire an event for each target found."""
+        for target in targets:
+            target_event_data = target.copy()
+            target_event_data[ATTR_ENTITY_ID] = self.entity_id
+            if saved_image_path:
+                target_event_data[SAVED_FILE] = saved_image_path
+            self.hass.bus.async_fire(EVENT_OBJECT_DETECTED, target_event_data)
+
+    def _detect_labels(self, image) -> dict:
+        """Send the image to Rekognition, returning the response."""
+        self._image = Image.open(io.BytesIO(image))  # Lazy, only reads the header
+        self._image_width, self._image_height = self._image.size
+
+        # resize image if different then default
+        if self._scale != DEAULT_SCALE:
+            newsize = (self._image_width * self._scale, self._image_width * self._scale)
+            self._image.thumbnail(newsize, Image.ANTIALIAS)
+            self._image_width, self._image_height = self._image.size
+            with io.BytesIO() as output:
+                self._image.save(output, format="JPEG")
+                image = output.getvalue()
+            _LOGGER.debug(
+                (
+                    f"Image scaled with : {self._scale} W={self._image_width} H={self._image_height}"
+                )
+            )
+
+        # Rekognition boxes are normalised, so only the uploaded image is shrunk
+        # and saved images keep their resolution.
+        if self._max_dimension and (
+            max(self._image_width, self._image_height) > self._max_dimension
+        ):
+            image = resize_image(image, self._max_dimension)
+            _LOGGER.debug(
+                f"Image resized to fit {self._max_dimension} for Rekognition"
+            )
+
+        REKOGNITION_RATE_LIMITER.wait()
+        return self._aws_rekognition_client.detect_labels(Image={"Bytes": image})
+
     @property
     def camera_entity(self):
         """Return camera entity id from process pictures."""
@@ -476,65 +720,104 @@ class ObjectDetection(ImageProcessingEntity):
         attr["labels"] = self._labels
         return attr
 
-    def save_image(self, targets, directory) -> str:
-        """Draws the actual bounding box of the detected objects.
+    def _latest_save_path(self, directory) -> Path:
+        """Return the path of the latest saved image."""
+        return directory / f"{self._valid_filename}_latest.{self._save_file_format}"
+
+    def _timestamp_save_path(self, directory, last_detection) -> Path:
+        """Return the path of the image saved with the time of detection."""
+        return directory / f"{self._name}_{last_detection}.{self._save_file_format}"
+
+    def save_image(self, image, targets, directory, last_detection) -> str:
+        """Draws the actual bounding box of the detected objects and saves the image.
+
+        Runs in the writer thread, so only uses the arguments passed and the fixed config.
 
         Returns: saved_image_path, which is the path to the saved timestamped file if configured, else the default saved image.
         """
+        roi_tuple = tuple(self._roi_dict.values())
+        draw_roi = roi_tuple != DEFAULT_ROI and self._show_boxes
         try:
-            img = self._image.convert("RGB")
+            img = Image.open(io.BytesIO(image))
         except UnidentifiedImageError:
             _LOGGER.warning("Rekognition unable to process image, bad data")
             return
+
+        scaled = self._scale != DEAULT_SCALE
+        if not (scaled or draw_roi or (targets and self._show_boxes)) and (
+            img.format == PIL_FORMATS[self._save_file_format]
+        ):
+            # Nothing to change, so save the image bytes without decoding them
+            data = image
+        else:
+            if scaled:
+                # Scale the camera image here, so saved images are only encoded once
+                newsize = (img.width * self._scale, img.width * self._scale)
+                img.thumbnail(newsize, Image.ANTIALIAS)
+            # convert() always copies, so only call it when the mode can't be drawn
+            # on and saved as is, JPEG has no alpha channel.
+            if img.mode not in RGB_MODES[self._save_file_format]:
+                img = img.convert("RGB")
+            self._draw_boxes(img, targets, roi_tuple if draw_roi else None)
+            # Encode once, even if saving both the latest and timestamped files
+            with io.BytesIO() as output:
+                img.save(output, format=PIL_FORMATS[self._save_file_format])
+                data = output.getvalue()
+
+        latest_save_path = self._latest_save_path(directory)
+        latest_save_path.write_bytes(data)
+        _LOGGER.info("Rekognition saved file %s", latest_save_path)
+
+        if self._save_timestamped_file:
+            timestamp_save_path = self._timestamp_save_path(directory, last_detection)
+            timestamp_save_path.write_bytes(data)
+            _LOGGER.info("Rekognition saved file %s", timestamp_save_path)
+            if self._s3_bucket:
+                filename = timestamp_save_path.name
+                self._aws_s3_client.upload_file(Filename=str(timestamp_save_path), Bucket=self._s3_bucket, Key=filename)
+                _LOGGER.info(
+                    f"Uploaded file {filename} to S3"
+                )
+            return str(timestamp_save_path)
+        return str(latest_save_path)
+
+    def _draw_boxes(self, img, targets, roi_tuple):
+        """Draw the roi, if given, and the targets onto img."""
+        # Only needed when saving, so not imported with the platform
+        from PIL import ImageDraw, ImageFont
+
+        if self._font is None:
+            self._font = ImageFont.load_default()
+        font = self._font
         draw = ImageDraw.Draw(img)
 
-        roi_tuple = tuple(self._roi_dict.values())
-        if roi_tuple != DEFAULT_ROI and self._show_boxes:
-            draw_box(
-                draw, roi_tuple, img.width, img.height, text="ROI", color=GREEN,
-            )
+        width, height = img.size
+
+        if roi_tuple:
+            draw_box(draw, roi_tuple, width, height, font, text="ROI", color=GREEN)
+
+        if not self._show_boxes:
+            return
 
         for obj in targets:
-            if not self._show_boxes:
-                break
-            name = obj["name"]
-            confidence = obj["confidence"]
             box = obj["bounding_box"]
             centroid = obj["centroid"]
-            box_label = f"{name}: {confidence:.1f}%"
+            box_label = f"{obj['name']}: {obj['confidence']:.1f}%"
 
             draw_box(
                 draw,
                 (box["y_min"], box["x_min"], box["y_max"], box["x_max"]),
-                img.width,
-                img.height,
+                width,
+                height,
+                font,
                 text=box_label,
                 color=RED,
             )
 
             # draw bullseye
             draw.text(
-                (centroid["x"] * img.width, centroid["y"] * img.height),
+                (centroid["x"] * width, centroid["y"] * height),
                 text="X",
                 fill=RED,
+                font=font,
             )
-
-        latest_save_path = (
-            directory / f"{get_valid_filename(self._name).lower()}_latest.{self._save_file_format}"
-        )
-        img.save(latest_save_path)
-        _LOGGER.info("Rekognition saved file %s", latest_save_path)
-        saved_image_path = latest_save_path
-
-        if self._save_timestamped_file:
-            filename = f"{self._name}_{self._last_detection}.{self._save_file_format}"
-            timestamp_save_path = directory / filename
-            img.save(timestamp_save_path)
-            _LOGGER.info("Rekognition saved file %s", timestamp_save_path)
-            if self._s3_bucket:
-                self._aws_s3_client.upload_file(Filename=str(timestamp_save_path), Bucket=self._s3_bucket, Key=filename)
-                _LOGGER.info(
-                    f"Uploaded file {filename} to S3"
-                )
-            return str(timestamp_save_path)
-        return str(saved_image_path)
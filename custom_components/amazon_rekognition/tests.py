@@ -1,5 +1,19 @@
 """The tests for the Amazon Rekognition component."""
-from .image_processing import get_objects
+import io
+import threading
+import time
+from unittest.mock import MagicMock
+
+from PIL import Image
+
+from .image_processing import (
+    ImageWriter,
+    ObjectDetection,
+    RateLimiter,
+    get_objects,
+    parse_response,
+    resize_image,
+)
 
 TARGET = "person"
 MOCK_HIGH_CONFIDENCE = 95.0
@@ -179,3 +193,139 @@ def test_get_objects():
     assert len(labels) == 9
     assert objects[0] == PARSED_RESPONSE
     assert labels[0] == {"name": "human", "confidence": 99.853}
+
+
+def test_parse_response():
+    roi = {"y_min": 0.0, "x_min": 0.0, "y_max": 1.0, "x_max": 1.0}
+    objects, labels, targets_found = parse_response(
+        MOCK_RESPONSE, {TARGET: MOCK_HIGH_CONFIDENCE}, roi
+    )
+    assert len(objects) == 5
+    assert len(labels) == 9
+    assert targets_found == [PARSED_RESPONSE]
+
+    _, _, targets_found = parse_response(
+        MOCK_RESPONSE, {TARGET: MOCK_LOW_CONFIDENCE}, roi
+    )
+    assert len(targets_found) == 2
+
+    roi["x_min"] = 0.5  # Excludes the person centred at x=0.304
+    _, _, targets_found = parse_response(
+        MOCK_RESPONSE, {TARGET: MOCK_LOW_CONFIDENCE}, roi
+    )
+    assert targets_found == [PARSED_RESPONSE]
+
+
+def test_resize_image():
+    with io.BytesIO() as output:
+        Image.new("RGBA", (2000, 1000)).save(output, format="PNG")
+        image = output.getvalue()
+    resized = Image.open(io.BytesIO(resize_image(image, 1280)))
+    assert resized.format == "JPEG"
+    assert resized.mode == "RGB"
+    assert resized.size == (1280, 640)
+
+
+def test_rate_limiter():
+    rate_limiter = RateLimiter(rate=100)
+    start = time.monotonic()
+    for _ in range(3):
+        rate_limiter.wait()
+    assert time.monotonic() - start >= 0.02
+
+
+def start_blocking_save(writer: ImageWriter) -> threading.Event:
+    """Occupy the writer thread until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_save():
+        started.set()
+        release.wait()
+
+    writer.submit("blocking", blocking_save)
+    started.wait()
+    return release
+
+
+def test_image_writer_replaces_pending_saves():
+    writer = ImageWriter(maxsize=4)
+    release = start_blocking_save(writer)
+
+    latest = writer.submit("cam1", lambda: "latest", replaceable=True)
+    newer = writer.submit("cam1", lambda: "newer", replaceable=True)
+    other_camera = writer.submit("cam2", lambda: "other camera", replaceable=True)
+    timestamped = writer.submit("cam3", lambda: "timestamped")
+    timestamped_too = writer.submit("cam3", lambda: "timestamped too")
+    release.set()
+
+    assert latest.cancelled()
+    assert newer.result(timeout=1) == "newer"
+    assert other_camera.result(timeout=1) == "other camera"
+    assert timestamped.result(timeout=1) == "timestamped"
+    assert timestamped_too.result(timeout=1) == "timestamped too"
+    writer.stop()
+
+
+def test_image_writer_stop():
+    writer = ImageWriter(maxsize=1)
+    release = start_blocking_save(writer)
+    queued = writer.submit("cam1", lambda: "queued")  # Fills the queue
+
+    writer.stop()  # Must not block on the full queue
+    assert writer.submit("cam2", lambda: "after stop").cancelled()
+    release.set()
+
+    assert queued.result(timeout=1) == "queued"
+
+
+class StubRekognitionClient:
+    """Count detect_labels calls, always returning MOCK_RESPONSE."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def detect_labels(self, Image):
+        self.calls += 1
+        return MOCK_RESPONSE
+
+
+def make_image(color: str) -> bytes:
+    with io.BytesIO() as output:
+        Image.new("RGB", (64, 64), color).save(output, format="JPEG")
+        return output.getvalue()
+
+
+def test_unchanged_image_reuses_response():
+    client = StubRekognitionClient()
+    entity = ObjectDetection(
+        rekognition_client=client,
+        s3_client=None,
+        executor=None,
+        writer=None,
+        region="us-east-1",
+        targets=[{"target": TARGET}],
+        confidence=MOCK_HIGH_CONFIDENCE,
+        roi_y_min=0.0,
+        roi_x_min=0.0,
+        roi_y_max=1.0,
+        roi_x_max=1.0,
+        scale=1.0,
+        max_dimension=0,
+        show_boxes=True,
+        save_file_format="jpg",
+        save_file_folder=None,
+        save_timestamped_file=False,
+        always_save_latest_file=False,
+        s3_bucket=None,
+        camera_entity="camera.test",
+    )
+    entity.hass = MagicMock()
+
+    image = make_image("red")
+    entity.process_image(image)
+    entity.process_image(image)
+    assert client.calls == 1
+    assert entity.state == 1
+
+    entity.process_image(make_image("blue"))
+    assert client.calls == 2